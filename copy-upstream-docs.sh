@@ -65,31 +65,44 @@ fi
 
 echo "Will search in '$UPSTREAM_SITE' and '$REFERENCE_DOCS' (if exists) to copy .md → .mdx to $DEST_DIR"
 
-transform_docs() {
+# Number of files to transform concurrently
+JOBS="${JOBS:-$(getconf _NPROCESSORS_ONLN 2>/dev/null || echo 4)}"
+
+transform_file() {
     local SOURCE_DIR="$1"
-    if [ ! -d "$SOURCE_DIR" ]; then
-        echo "Warning: source directory '$SOURCE_DIR' not found, skipping"
-        return
-    fi
+    local source_file="$2"
 
-    find "$SOURCE_DIR" -name "*.md" -type f | while read -r source_file; do
-        # Derive the relative path inside the source tree
-        relative_path="${source_file#$SOURCE_DIR/}"
-        target_file="${relative_path%.md}.mdx"
-        target_dir=$(dirname "$DEST_DIR/$target_file")
+    # Derive the relative path inside the source tree
+    relative_path="${source_file#$SOURCE_DIR/}"
+    target_file="${relative_path%.md}.mdx"
+    target_dir=$(dirname "$DEST_DIR/$target_file")
 
-        mkdir -p "$target_dir"
+    mkdir -p "$target_dir"
 
-        # Check if this file is in the BROKEN_FILES list
-        if echo "$BROKEN_FILES" | grep -q "^$target_file$"; then
-            echo "Skipping broken file: $target_file"
-            continue
-        fi
+    # Check if this file is in the BROKEN_FILES list
+    if echo "$BROKEN_FILES" | grep -q "^$target_file$"; then
+        echo "Skipping broken file: $target_file"
+        return
+    fi
 
     # Transform and copy the file
     echo "Transforming and copying $source_file to $DEST_DIR/$target_file"
     awk -f transform-docs.awk "$source_file" > "$DEST_DIR/$target_file"
-    done
+}
+export -f transform_file
+export DEST_DIR BROKEN_FILES
+
+transform_docs() {
+    local SOURCE_DIR="$1"
+    if [ ! -d "$SOURCE_DIR" ]; then
+        echo "Warning: source directory '$SOURCE_DIR' not found, skipping"
+        return
+    fi
+
+    # Each file is independent, so run up to $JOBS awk processes at once
+    find "$SOURCE_DIR" -name "*.md" -type f -print0 |
+        xargs -0 -n 1 -P "$JOBS" bash -c \
+            'set -o errexit -o nounset -o pipefail; transform_file "$0" "$1"' "$SOURCE_DIR"
 }
 
 # Copy from both sources
@@ -2,19 +2,58 @@ package main
 
 import (
 	"archive/zip"
+	"encoding/json"
 	"flag"
 	"fmt"
 	"io"
 	"os"
 	"path/filepath"
+	"runtime"
+	"runtime/debug"
 	"strings"
+	"sync"
+	"sync/atomic"
 
 	md "github.com/JohannesKaufmann/html-to-markdown"
 )
 
+// cacheFileName is written to the output directory and records which zip
+// entries were converted, so a re-run into the same directory can skip
+// entries whose CRC32 and size are unchanged.
+const cacheFileName = ".html2md-cache.json"
+
+// cacheVersion is part of the stamp saved with the cache. Bump it whenever
+// a change here alters the markdown written for the same input, such as
+// different converter options, so that older output is converted again.
+const cacheVersion = 1
+
+const converterModule = "github.com/JohannesKaufmann/html-to-markdown"
+
+type cacheEntry struct {
+	CRC32 uint32 `json:"crc32"`
+	Size  uint64 `json:"size"`
+}
+
+// cacheFile is the on-disk form of the cache. Entries saved under a
+// different stamp were written by another converter and are not reused.
+type cacheFile struct {
+	Stamp   string                `json:"stamp"`
+	Entries map[string]cacheEntry `json:"entries"`
+}
+
+type conversionCache struct {
+	stamp    string
+	previous map[string]cacheEntry
+
+	mu      sync.Mutex
+	current map[string]cacheEntry
+}
+
 func main() {
 	zipPath := flag.String("zip", "", "Path to the zip file containing HTML files")
 	outputDir := flag.String("output", "output", "Output directory for markdown files")
+	workers := flag.Int("workers", runtime.NumCPU(), "Number of files to convert concurrently")
+	force := flag.Bool("force", false, "Convert every file, ignoring the cache from previous runs")
 	flag.Parse()
 
 	if *zipPath == "" {
@@ -23,7 +62,7 @@ func main() {
 		os.Exit(1)
 	}
 
-	if err := convertZipToMarkdown(*zipPath, *outputDir); err != nil {
+	if err := convertZipToMarkdown(*zipPath, *outputDir, *workers, *force); err != nil {
 		fmt.Printf("Error: %v\n", err)
 		os.Exit(1)
 	}
@@ -31,7 +70,7 @@ func main() {
 	fmt.Println("Conversion completed successfully!")
 }
 
-func convertZipToMarkdown(zipPath, outputDir string) error {
+func convertZipToMarkdown(zipPath, outputDir string, workers int, force bool) error {
 	// Open the zip file
 	r, err := zip.OpenReader(zipPath)
 	if err != nil {
@@ -39,19 +78,201 @@ func convertZipToMarkdown(zipPath, outputDir string) error {
 	}
 	defer r.Close()
 
-	// Create markdown converter
-	converter := md.NewConverter("", true, nil)
+	if workers < 1 {
+		workers = 1
+	}
+
+	cache := newConversionCache()
+	if !force {
+		cache.load(outputDir)
+	}
+
+	var (
+		wg       sync.WaitGroup
+		errOnce  sync.Once
+		firstErr error
+		failed   atomic.Bool
+	)
+	groups := make(chan []*zip.File)
+
+	// Each worker owns its markdown converter and pulls groups until the
+	// channel is drained; after the first failure the rest are skipped.
+	for i := 0; i < workers; i++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			converter := md.NewConverter("", true, nil)
+			for group := range groups {
+				// Entries sharing an output path are written in zip order so
+				// the last one wins, as in a sequential run. The cache can
+				// only vouch for the output of a lone entry.
+				for _, f := range group {
+					if failed.Load() {
+						break
+					}
+					outputPath, cacheable := outputPathFor(f, outputDir)
+					cacheable = cacheable && len(group) == 1
+					if cacheable && cache.upToDate(f, outputPath) {
+						fmt.Printf("Unchanged, skipping: %s\n", f.Name)
+						cache.record(f)
+						continue
+					}
+					if err := processZipFile(f, outputDir, converter); err != nil {
+						errOnce.Do(func() {
+							firstErr = fmt.Errorf("failed to process %s: %w", f.Name, err)
+							failed.Store(true)
+						})
+						break
+					}
+					if cacheable {
+						cache.record(f)
+					}
+				}
+			}
+		}()
+	}
 
 	// Process each file in the zip
-	for _, f := range r.File {
-		if err := processZipFile(f, outputDir, converter); err != nil {
-			return fmt.Errorf("failed to process %s: %w", f.Name, err)
-		}
+	for _, group := range groupByOutputPath(r.File, outputDir) {
+		groups <- group
+	}
+	close(groups)
+	wg.Wait()
+
+	// Save whatever was converted, even after a failure, so the next run
+	// resumes instead of starting over
+	if err := cache.save(outputDir); err != nil && firstErr == nil {
+		firstErr = err
 	}
 
+	return firstErr
+}
+
+func newConversionCache() *conversionCache {
+	return &conversionCache{
+		stamp:    converterStamp(),
+		previous: make(map[string]cacheEntry),
+		current:  make(map[string]cacheEntry),
+	}
+}
+
+func (c *conversionCache) load(outputDir string) {
+	data, err := os.ReadFile(filepath.Join(outputDir, cacheFileName))
+	if err != nil {
+		return
+	}
+	var saved cacheFile
+	if err := json.Unmarshal(data, &saved); err != nil {
+		fmt.Printf("Ignoring unreadable cache file: %v\n", err)
+		return
+	}
+	if saved.Stamp != c.stamp {
+		fmt.Println("Converter changed since the cache was written, converting every file")
+		return
+	}
+	for name, entry := range saved.Entries {
+		c.previous[name] = entry
+	}
+}
+
+// upToDate reports whether f matches the previous run and its output still
+// exists. It only reads c.previous, which is never written after load.
+func (c *conversionCache) upToDate(f *zip.File, outputPath string) bool {
+	entry, ok := c.previous[f.Name]
+	if !ok || entry != cacheEntryFor(f) {
+		return false
+	}
+	_, err := os.Stat(outputPath)
+	return err == nil
+}
+
+func (c *conversionCache) record(f *zip.File) {
+	c.mu.Lock()
+	c.current[f.Name] = cacheEntryFor(f)
+	c.mu.Unlock()
+}
+
+func (c *conversionCache) save(outputDir string) error {
+	data, err := json.MarshalIndent(cacheFile{Stamp: c.stamp, Entries: c.current}, "", "  ")
+	if err != nil {
+		return fmt.Errorf("failed to encode cache: %w", err)
+	}
+	if err := os.MkdirAll(outputDir, 0755); err != nil {
+		return fmt.Errorf("failed to create output directory: %w", err)
+	}
+	if err := os.WriteFile(filepath.Join(outputDir, cacheFileName), data, 0644); err != nil {
+		return fmt.Errorf("failed to write cache file: %w", err)
+	}
 	return nil
 }
 
+// converterStamp identifies the conversion this binary performs: the cache
+// version and the html-to-markdown release it was built with.
+func converterStamp() string {
+	stamp := fmt.Sprintf("v%d", cacheVersion)
+	info, ok := debug.ReadBuildInfo()
+	if !ok {
+		return stamp
+	}
+	for _, dep := range info.Deps {
+		if dep.Path != converterModule {
+			continue
+		}
+		if dep.Replace != nil {
+			dep = dep.Replace
+		}
+		return stamp + " " + dep.Path + "@" + dep.Version
+	}
+	return stamp
+}
+
+// cacheEntryFor uses the CRC32 and size from the zip directory, so checking
+// an entry never requires decompressing it.
+func cacheEntryFor(f *zip.File) cacheEntry {
+	return cacheEntry{CRC32: f.CRC32, Size: f.UncompressedSize64}
+}
+
+// outputPathFor returns where processZipFile writes f, and false for entries
+// it does not write.
+func outputPathFor(f *zip.File, outputDir string) (string, bool) {
+	if f.FileInfo().IsDir() {
+		return "", false
+	}
+	if isMarkdownFile(f.Name) {
+		return filepath.Join(outputDir, f.Name), true
+	}
+	if isHTMLFile(f.Name) {
+		return filepath.Join(outputDir, changeExtension(f.Name, ".md")), true
+	}
+	return "", false
+}
+
+// groupByOutputPath splits files into groups that no two workers may
+// write at once: entries that map to the same output path, such as foo.htm
+// and foo.html, share a group in zip order, and every other entry is a
+// group of its own.
+func groupByOutputPath(files []*zip.File, outputDir string) [][]*zip.File {
+	groups := make([][]*zip.File, 0, len(files))
+	byPath := make(map[string]int)
+	for _, f := range files {
+		outputPath, ok := outputPathFor(f, outputDir)
+		if !ok {
+			groups = append(groups, []*zip.File{f})
+			continue
+		}
+		i, seen := byPath[outputPath]
+		if !seen {
+			byPath[outputPath] = len(groups)
+			groups = append(groups, []*zip.File{f})
+			continue
+		}
+		fmt.Printf("Warning: %s and %s both write %s; the later entry wins\n",
+			groups[i][len(groups[i])-1].Name, f.Name, outputPath)
+		groups[i] = append(groups[i], f)
+	}
+	return groups
+}
+
 func processZipFile(f *zip.File, outputDir string, converter *md.Converter) error {
 	// Skip directories
 	if f.FileInfo().IsDir() {
@@ -78,14 +299,8 @@ func processZipFile(f *zip.File, outputDir string, converter *md.Converter) erro
 	}
 	defer rc.Close()
 
-	// Read HTML content
-	htmlBytes, err := io.ReadAll(rc)
-	if err != nil {
-		return fmt.Errorf("failed to read HTML content: %w", err)
-	}
-
-	// Convert HTML to Markdown
-	markdown, err := converter.ConvertString(string(htmlBytes))
+	// Convert HTML to Markdown straight from the zip stream
+	markdown, err := converter.ConvertReader(rc)
 	if err != nil {
 		return fmt.Errorf("failed to convert HTML to markdown: %w", err)
 	}
@@ -99,7 +314,7 @@ func processZipFile(f *zip.File, outputDir string, converter *md.Converter) erro
 	}
 
 	// Write markdown file
-	if err := os.WriteFile(outputPath, []byte(markdown), 0644); err != nil {
+	if err := os.WriteFile(outputPath, markdown.Bytes(), 0644); err != nil {
 		return fmt.Errorf("failed to write markdown file: %w", err)
 	}
 
@@ -140,12 +355,6 @@ func copyFile(f *zip.File, outputDir string, outputPath string) error {
 	}
 	defer rc.Close()
 
-	// Read content
-	content, err := io.ReadAll(rc)
-	if err != nil {
-		return fmt.Errorf("failed to read content: %w", err)
-	}
-
 	// Create output path
 	fullOutputPath := filepath.Join(outputDir, outputPath)
 
@@ -154,8 +363,16 @@ func copyFile(f *zip.File, outputDir string, outputPath string) error {
 		return fmt.Errorf("failed to create output directory: %w", err)
 	}
 
-	// Write file
-	if err := os.WriteFile(fullOutputPath, content, 0644); err != nil {
+	// Stream the entry to disk without holding it in memory
+	out, err := os.OpenFile(fullOutputPath, os.O_WRONLY|os.O_CREATE|os.O_TRUNC, 0644)
+	if err != nil {
+		return fmt.Errorf("failed to write file: %w", err)
+	}
+	if _, err := io.Copy(out, rc); err != nil {
+		out.Close()
+		return fmt.Errorf("failed to write file: %w", err)
+	}
+	if err := out.Close(); err != nil {
 		return fmt.Errorf("failed to write file: %w", err)
 	}
 
@@ -34,8 +34,9 @@ def cli(ctx, verbose, config):
 @click.option('--output', '-o', required=True, help='Output directory for Hugo site')
 @click.option('--dry-run', is_flag=True, help='Validate conversion without writing files')
 @click.option('--incremental', is_flag=True, help='Only convert changed files')
+@click.option('--jobs', '-j', type=int, default=None, help='Worker processes for content files (default: CPU count)')
 @click.pass_context
-def convert(ctx, source, output, dry_run, incremental):
+def convert(ctx, source, output, dry_run, incremental, jobs):
     """Convert Devsite documentation to Hugo format"""
     try:
         # Initialize converter
@@ -57,7 +58,7 @@ def convert(ctx, source, output, dry_run, incremental):
             click.echo("Running in incremental mode - only changed files will be converted")
         
         # Perform conversion
-        success = converter.convert_documentation(source, output, dry_run, incremental)
+        success = converter.convert_documentation(source, output, dry_run, incremental, jobs)
         
         if success:
             click.echo("✅ Conversion completed successfully!")
@@ -3,15 +3,81 @@ Devsite to Hugo/Docsy Converter
 Main conversion utility for transforming Google Devsite documentation to Hugo format
 """
 
+import functools
+import hashlib
+import json
 import logging
+import os
 import shutil
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 import yaml
 import re
 from utils.devsite_parser import DevsiteParser
 from utils.hugo_generator import HugoGenerator
 
+# Prefer the libyaml-backed loader and dumper; they handle the same
+# documents much faster
+try:
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
+# YAML frontmatter block at the top of a page (the body is whatever
+# follows the match), and the page's first H1
+_FRONTMATTER_RE = re.compile(r'---\n(.*?)\n---\n', re.DOTALL)
+_H1_RE = re.compile(r'^# (.+)$', re.MULTILINE)
+
+# Devsite-only markup removed from page bodies, applied in this order:
+# {: #anchor } and {: .class } attributes, Jekyll includes,
+# devsite-mathjax directives (which may span lines) and finally the
+# Project:/Book: header lines. The line patterns are anchored against the
+# text left by the earlier removals, and a mathjax opener on a header
+# line still takes its whole block with it
+_ANCHOR_ATTR_RE = re.compile(r'\s*\{:\s*#[^}]+\s*\}')
+_CLASS_ATTR_RE = re.compile(r'\s*\{:\s*\.[^}]+\s*\}')
+_INCLUDE_RE = re.compile(r'\{\%\s*include\s+[^%]+\%\}')
+_MATHJAX_RE = re.compile(r'<devsite-mathjax[^>]*>.*?</devsite-mathjax>', re.DOTALL)
+# \s* can run past the end of the header line, so Project: and Book: are
+# separate passes too
+_PROJECT_RE = re.compile(r'^Project:\s*.*$', re.MULTILINE)
+_BOOK_RE = re.compile(r'^Book:\s*.*$', re.MULTILINE)
+_EXTRA_BLANK_LINES_RE = re.compile(r'\n\s*\n\s*\n')
+
+# Markdown links, including ones whose URL wraps onto the next line
+_LINK_RE = re.compile(r'\[([^\]]+)\]\(([^)]+)\)', re.DOTALL)
+_EXTERNAL_SCHEMES = ('http://', 'https://', 'mailto:', 'tel:', 'ftp://')
+
+# Directory trees drawn with Unicode box characters
+_TREE_RE = re.compile(
+    r'(following directory structure:?\s*(?:\n|```?)?\s*)(└.*?(?:\n.*?[├└│].*?)*)',
+    re.DOTALL | re.MULTILINE)
+_INLINE_TREE_RE = re.compile(r'(```\s*)(└.*?(?:\n.*?[├└│].*?)*)(```)', re.DOTALL)
+
+# First line that is an H1 once surrounding whitespace is stripped, and a
+# run of whitespace-only lines
+_H1_LINE_RE = re.compile(r'^[^\S\n]*# (.*\S)', re.MULTILINE)
+_BLANK_LINES_RE = re.compile(r'(?:[^\S\n]*\n)*')
+
+# Devsite frontmatter fields carried over to Hugo under the same name
+_FRONTMATTER_FIELDS = ('title', 'description', 'project_path', 'book_path', 'toc')
+
+# Frontmatter keys and string values that yaml.dump writes unquoted: a
+# letter first, no indicator characters, no trailing space, and not one of
+# the words YAML reads back as a bool or null
+_PLAIN_YAML_RE = re.compile(r"[A-Za-z](?:[A-Za-z0-9 _.,/()&+'-]*[A-Za-z0-9_.,/()&+'-])?")
+_YAML_RESERVED_WORDS = frozenset(
+    'yes Yes YES no No NO true True TRUE false False FALSE '
+    'on On ON off Off OFF null Null NULL'.split())
+# yaml.dump folds plain scalars on lines longer than this
+_YAML_LINE_WIDTH = 80
+
+# Written to the output directory by every run that is not a dry run; maps each source file
+# (relative to the source root) to the SHA-256 of the content last converted
+# and the mtime/size it had then, so unchanged files are not even re-read
+CONVERSION_CACHE_FILE = '.conversion_cache.json'
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -31,14 +97,42 @@ class DevsiteToHugoConverter:
         """
         self.config_path = config_path
         self.config = self._load_config()
-        self.devsite_parser = DevsiteParser(self.config)
-        self.hugo_generator = HugoGenerator(self.config)
+
+        # Config-derived lookup tables, consulted for every file and link
+        self._content_mapping = self.config.get('content_mapping', {})
+        external_links = self.config.get('external_links', {})
+        self._external_base = external_links.get('bazel_api_base', 'https://bazel.build')
+        self._external_paths = tuple(external_links.get('external_paths', []))
+        # (language, pattern) pairs flattened in config order, so the first
+        # hit still picks the first configured language
+        self._language_patterns = tuple(
+            (language, pattern)
+            for language, patterns in (self.config.get('code_language_patterns') or {}).items()
+            for pattern in patterns)
+        # Snippets such as install commands repeat across pages; the
+        # detection only depends on the snippet, so cache it per converter
+        self._determine_language = functools.lru_cache(maxsize=4096)(self._determine_language)
+
+        # Output directories already created by this converter
+        self._created_dirs: Set[Path] = set()
+
+    # Built on first use: worker processes and the info command never
+    # touch the site structure or templates
+    @functools.cached_property
+    def devsite_parser(self) -> DevsiteParser:
+        """Parser for the Devsite source structure"""
+        return DevsiteParser(self.config)
+
+    @functools.cached_property
+    def hugo_generator(self) -> HugoGenerator:
+        """Generator for the Hugo config and section indices"""
+        return HugoGenerator(self.config)
 
     def _load_config(self) -> Dict:
         """Load configuration from YAML file"""
         try:
             with open(self.config_path, 'r') as file:
-                config = yaml.safe_load(file)
+                config = yaml.load(file, Loader=SafeLoader)
                 logger.info(f"Configuration loaded from {self.config_path}")
                 return config
         except FileNotFoundError:
@@ -52,7 +146,8 @@ class DevsiteToHugoConverter:
                               source_path: str,
                               output_path: str,
                               dry_run: bool = False,
-                              incremental: bool = False) -> bool:
+                              incremental: bool = False,
+                              jobs: Optional[int] = None) -> bool:
         """
         Convert Devsite documentation to Hugo format
         
@@ -61,6 +156,8 @@ class DevsiteToHugoConverter:
             output_path: Path where Hugo site should be generated
             dry_run: If True, only validate without writing files
             incremental: If True, only convert changed files
+            jobs: Number of worker processes for content files; defaults
+                to the CPU count, 1 converts in this process
             
         Returns:
             True if conversion successful, False otherwise
@@ -85,13 +182,16 @@ class DevsiteToHugoConverter:
                 logger.error("Failed to parse Devsite structure")
                 return False
 
+            # Walk the source tree once for both content files and assets
+            source_files = self._collect_source_files(Path(source_path))
+
             # Convert content files
-            conversion_stats = self._convert_content_files(source_path, output_path, dry_run,
-                incremental)
+            conversion_stats = self._convert_content_files(source_path, output_path,
+                source_files, dry_run, incremental, jobs)
 
             # Convert static assets
             if not dry_run:
-                self._convert_assets(source_path, output_path)
+                self._convert_assets(source_path, output_path, source_files)
 
             # Generate Hugo configuration
             if not dry_run:
@@ -111,16 +211,22 @@ class DevsiteToHugoConverter:
         """Validate that source path contains expected Devsite structure"""
         source_dir = Path(source_path)
 
-        if not source_dir.exists():
+        # One directory listing answers both the existence check and the
+        # lookups for the key Devsite files
+        try:
+            with os.scandir(source_dir) as entries:
+                entry_names = {entry.name for entry in entries}
+        except FileNotFoundError:
             logger.error(f"Source path does not exist: {source_path}")
             return False
+        except OSError:
+            entry_names = set()
 
         # Check for key Devsite files
         expected_files = ['_book.yaml', '_index.yaml']
         for file_name in expected_files:
-            file_path = source_dir / file_name
-            if not file_path.exists():
-                logger.warning(f"Expected Devsite file not found: {file_path}")
+            if file_name not in entry_names:
+                logger.warning(f"Expected Devsite file not found: {source_dir / file_name}")
 
         return True
 
@@ -136,56 +242,113 @@ class DevsiteToHugoConverter:
 
         for directory in directories:
             dir_path = output_dir / directory
-            dir_path.mkdir(parents=True, exist_ok=True)
+            self._ensure_dir(dir_path)
             logger.debug(f"Created directory: {dir_path}")
 
     def _convert_content_files(self, 
                                source_path: str,
                                output_path: str, 
+                               source_files: Dict[str, List[Path]],
                                dry_run: bool,
-                               incremental: bool) -> Dict:
+                               incremental: bool,
+                               jobs: Optional[int] = None) -> Dict:
         """Convert all content files from Devsite to Hugo format"""
-        conversion_stats = {
-            'total_files': 0,
-            'converted_files': 0,
-            'skipped_files': 0,
-            'error_files': 0
-        }
-
         source_dir = Path(source_path)
         output_dir = Path(output_path)
 
-        # Process each markdown file
-        for md_file in source_dir.rglob('*.md'):
-            conversion_stats['total_files'] += 1
+        md_files = source_files.get('.md', [])
+
+        cache_keys = [md_file.relative_to(source_dir).as_posix() for md_file in md_files]
+        cache = self._load_conversion_cache(output_dir) if incremental else {}
+        tasks = [(md_file, source_dir, output_dir, dry_run, incremental, cache.get(key))
+                 for md_file, key in zip(md_files, cache_keys)]
 
+        if jobs is None:
+            jobs = os.cpu_count() or 1
+        jobs = min(jobs, len(tasks))
+
+        # Files are independent, so fan them out to worker processes. Each
+        # worker builds its own converter once; tasks only carry paths.
+        if jobs > 1:
             try:
-                # Calculate relative path from source
-                relative_path = md_file.relative_to(source_dir)
-
-                # Skip if incremental and file hasn't changed
-                if incremental and not self._file_needs_conversion(
-                        md_file, output_dir / 'content' / relative_path):
-                    conversion_stats['skipped_files'] += 1
-                    continue
-
-                # Determine category for this file
-                category_path = self._get_category_path(relative_path)
-                
-                # Convert file
-                if category_path == Path("how-to-guides"):
-                    raise Exception(f"{category_path} is not a valid category. Please update config.yaml to use 'docs' or 'tutorials' instead.")
-                if self._convert_single_file(
-                        md_file, output_dir / 'content' / category_path, dry_run):
-                    conversion_stats['converted_files'] += 1
-                else:
-                    conversion_stats['error_files'] += 1
+                executor = ProcessPoolExecutor(max_workers=jobs,
+                                               initializer=_init_worker,
+                                               initargs=(self.config_path,))
+            except (OSError, NotImplementedError) as e:
+                logger.warning(f"Process pool unavailable, converting sequentially: {e}")
+                jobs = 1
+
+        if jobs > 1:
+            with executor:
+                chunksize = max(1, len(tasks) // (jobs * 4))
+                results = list(executor.map(_convert_in_worker, tasks, chunksize=chunksize))
+        else:
+            results = [self._convert_content_file(*task) for task in tasks]
+
+        # Full runs rewrite the cache too; otherwise an entry from an older
+        # incremental run could match reverted source and skip it while
+        # newer output stays on disk
+        if not dry_run:
+            new_cache = {key: entry
+                         for key, (_, entry) in zip(cache_keys, results)
+                         if entry is not None}
+            self._save_conversion_cache(output_dir, new_cache)
+
+        # Tally statuses once at the end instead of bumping a dict per file
+        statuses = [status for status, _ in results]
+        return {
+            'total_files': len(md_files),
+            'converted_files': statuses.count('converted_files'),
+            'skipped_files': statuses.count('skipped_files'),
+            'error_files': statuses.count('error_files')
+        }
 
-            except Exception as e:
-                logger.error(f"Error converting {md_file}: {e}")
-                conversion_stats['error_files'] += 1
+    def _convert_content_file(self,
+                              md_file: Path,
+                              source_dir: Path,
+                              output_dir: Path,
+                              dry_run: bool,
+                              incremental: bool,
+                              cached_entry: Optional[Dict] = None) -> Tuple[str, Optional[Dict]]:
+        """
+        Convert one content file
+
+        Returns:
+            The stats key the file counts towards, and the cache entry to keep
+            for it (None when it should be converted again next time)
+        """
+        try:
+            # Calculate relative path from source
+            relative_path = md_file.relative_to(source_dir)
+
+            # Determine category for this file
+            category_path = self._get_category_path(relative_path)
+            if category_path == Path("how-to-guides"):
+                raise ValueError(f"{category_path} is not a valid category. Please update config.yaml to use 'docs' or 'tutorials' instead.")
+            output_file = output_dir / 'content' / category_path
+
+            # Skip if incremental and file hasn't changed
+            cache_entry = None
+            if incremental:
+                needs_conversion, cache_entry = self._file_needs_conversion(
+                    md_file, output_file, cached_entry)
+                if not needs_conversion:
+                    return 'skipped_files', cache_entry
+            elif not dry_run:
+                # Full runs record what they convert as well, so a later
+                # incremental run compares against the output now on disk
+                cache_entry = self._source_cache_entry(md_file, md_file.stat())
+
+            # Convert file
+            if self._convert_single_file(md_file, output_file, dry_run):
+                return 'converted_files', cache_entry
+            return 'error_files', None
 
-        return conversion_stats
+        except Exception as e:
+            # Any failure stays with this page; letting it escape a worker
+            # would abort the whole run
+            logger.error(f"Error converting {md_file}: {e}")
+            return 'error_files', None
 
     def _get_category_path(self, relative_path: Path) -> Path:
         """Get the category path for a file based on its section"""
@@ -202,20 +365,20 @@ class DevsiteToHugoConverter:
             return Path("docs") / Path("reference") / parts[0]
         
         # Look up the category for this section
-        if section_name in self.config['content_mapping']:
-            mapping = self.config['content_mapping'][section_name]
+        mapping = self._content_mapping.get(section_name)
+        if mapping is not None:
             category_type = mapping['type']
             
             # Return path with category prefix
             return Path(category_type) / relative_path
-        raise Exception(f"No category mapping found for section '{section_name}', using original path")
+        raise ValueError(f"No category mapping found for section '{section_name}', using original path")
 
     def _convert_single_file(self, source_file: Path, output_file: Path, dry_run: bool) -> bool:
         """Convert a single markdown file from Devsite to Hugo format"""
         try:
-            # Read source file
-            with open(source_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+            # Read source file; text mode keeps universal newline
+            # handling, which the body patterns (all '\n'-based) rely on
+            content = source_file.read_text(encoding='utf-8')
 
             # Parse frontmatter and content
             frontmatter, body = self._parse_markdown_file(content)
@@ -224,7 +387,7 @@ class DevsiteToHugoConverter:
             hugo_frontmatter = self._convert_frontmatter(frontmatter=frontmatter)
             # Extract title from H1 if not present in frontmatter
             title_from_h1 = None
-            h1_match = re.search(r'^# (.+)$', body, re.MULTILINE)
+            h1_match = _H1_RE.search(body)
             if h1_match:
                 title_from_h1 = h1_match.group(1).strip()
 
@@ -246,11 +409,10 @@ class DevsiteToHugoConverter:
 
             if not dry_run:
                 # Ensure output directory exists
-                output_file.parent.mkdir(parents=True, exist_ok=True)
+                self._ensure_dir(output_file.parent)
 
-                # Write converted file
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write(hugo_content)
+                # Write converted file as one encoded buffer
+                output_file.write_bytes(hugo_content.encode('utf-8'))
 
                 logger.debug(f"Converted: {source_file} -> {output_file}")
 
@@ -263,16 +425,22 @@ class DevsiteToHugoConverter:
     def _parse_markdown_file(self, content: str) -> Tuple[Dict, str]:
         """Parse markdown file to extract frontmatter and body"""
         # Look for YAML frontmatter
-        frontmatter_pattern = r'^---\n(.*?)\n---\n(.*)'
-        match = re.match(frontmatter_pattern, content, re.DOTALL)
+        if not content.startswith('---\n'):
+            return {}, content
+        match = _FRONTMATTER_RE.match(content)
 
         if match:
             frontmatter_yaml = match.group(1)
-            body = match.group(2)
+            body = content[match.end():]
 
             try:
-                frontmatter = yaml.safe_load(frontmatter_yaml)
-                return frontmatter or {}, body
+                frontmatter = yaml.load(frontmatter_yaml, Loader=SafeLoader) or {}
+                # libyaml reads some malformed blocks (a stray tab, say) as a
+                # bare scalar rather than rejecting them
+                if not isinstance(frontmatter, dict):
+                    logger.warning("Failed to parse YAML frontmatter")
+                    return {}, body
+                return frontmatter, body
             except yaml.YAMLError:
                 logger.warning("Failed to parse YAML frontmatter")
                 return {}, content
@@ -281,65 +449,46 @@ class DevsiteToHugoConverter:
 
     def _convert_frontmatter(self, frontmatter: Dict) -> Dict:
         """Convert Devsite frontmatter to Hugo format"""
-        hugo_frontmatter = {}
-
         # Map common fields
-        field_mapping = {
-            'title': 'title',
-            'description': 'description',
-            'project_path': 'project_path',
-            'book_path': 'book_path',
-            'toc': 'toc'
-        }
-
-        for devsite_field, hugo_field in field_mapping.items():
-            if devsite_field in frontmatter:
-                hugo_frontmatter[hugo_field] = frontmatter[devsite_field]
+        hugo_frontmatter = {field: frontmatter[field]
+                            for field in _FRONTMATTER_FIELDS
+                            if field in frontmatter}
 
         # Add Hugo-specific fields
         hugo_frontmatter['weight'] = frontmatter.get('weight', 1)
 
-        # Add title from H1 if not present in frontmatter
-        if 'title' not in hugo_frontmatter:
-            # Extract title from first H1 in body content if available
-            # This will be passed from the body parameter later in the process
-            pass
-
-        # Determine linkTitle from title if not present
-        if 'title' in hugo_frontmatter and 'linkTitle' not in hugo_frontmatter:
+        # Determine linkTitle from title; a title taken from the H1 later
+        # in _convert_single_file does not get one
+        if 'title' in hugo_frontmatter:
             hugo_frontmatter['linkTitle'] = hugo_frontmatter['title']
 
         return hugo_frontmatter
 
     def _convert_body_content(self, body: str, source_file: Path) -> str:
         """Convert Devsite-specific content to Hugo format"""
-        # Remove [TOC] directive (let Docsy handle TOC automatically)
-        body = re.sub(r'\[TOC\]', '', body)
-
-        # Remove Devsite-specific anchor ID syntax {: #anchor-name }
-        body = re.sub(r'\s*\{:\s*#[^}]+\s*\}', '', body)
-
-        # Remove Devsite-specific attribute syntax {:.class-name}
-        body = re.sub(r'\s*\{:\s*\.[^}]+\s*\}', '', body)
-
-        # Remove Jekyll include statements
-        body = re.sub(r'\{\%\s*include\s+[^%]+\%\}', '', body)
-
-        # Remove devsite-mathjax directives
-        body = re.sub(r'<devsite-mathjax[^>]*>.*?</devsite-mathjax>',
-                      '',
-                      body,
-                      flags=re.DOTALL)
-
-        # Remove Project and Book references
-        body = re.sub(r'^Project:\s*.*$', '', body, flags=re.MULTILINE)
-        body = re.sub(r'^Book:\s*.*$', '', body, flags=re.MULTILINE)
+        # Remove [TOC] (Docsy builds its own), {: #anchor } and {:.class}
+        # attributes and Jekyll includes. Each removal can expose the next
+        # one, so they stay separate passes; the substring checks skip the
+        # passes that cannot match
+        body = body.replace('[TOC]', '')
+        if '{:' in body:
+            body = _ANCHOR_ATTR_RE.sub('', body)
+            body = _CLASS_ATTR_RE.sub('', body)
+        if '{%' in body:
+            body = _INCLUDE_RE.sub('', body)
+
+        # Remove devsite-mathjax directives before the Project/Book lines; a
+        # block can open on a header line, which is removed only to its end
+        if '<devsite-mathjax' in body:
+            body = _MATHJAX_RE.sub('', body)
+
+        # Remove Project and Book references from what is left
+        body = _PROJECT_RE.sub('', body)
+        body = _BOOK_RE.sub('', body)
 
         # Clean up extra whitespace and empty lines
-        body = re.sub(r'\n\s*\n\s*\n', '\n\n',
-                      body)  # Replace multiple empty lines with single
-        body = re.sub(r'^\s*\n', '', body)  # Remove leading empty lines
-        body = body.strip()  # Remove trailing whitespace
+        body = _EXTRA_BLANK_LINES_RE.sub('\n\n', body)  # Replace multiple empty lines with single
+        body = body.strip()  # Remove leading empty lines and trailing whitespace
 
         # Convert internal links
         body = self._convert_internal_links(body, source_file)
@@ -358,46 +507,41 @@ class DevsiteToHugoConverter:
         if not frontmatter_title:
             return body
 
-        lines = body.strip().split('\n')
-        if not lines:
-            return body
+        content = body.strip()
 
         # Look for the first H1 in the content (not necessarily the first line)
-        for i, line in enumerate(lines):
-            stripped_line = line.strip()
-            if stripped_line.startswith('# '):
-                h1_title = stripped_line[2:].strip()
-
-                # If titles match, remove the H1 line and any immediately following empty lines
-                if h1_title.lower() == frontmatter_title.lower():
-                    # Remove the H1 line
-                    remaining_lines = lines[:i] + lines[i + 1:]
-
-                    # Remove any empty lines immediately following where the H1 was
-                    while i < len(remaining_lines
-                                  ) and remaining_lines[i].strip() == '':
-                        remaining_lines.pop(i)
-
-                    return '\n'.join(remaining_lines)
-                break  # Stop after finding the first H1
+        h1_match = _H1_LINE_RE.search(content)
+        if not h1_match or (h1_match.group(1).strip().lower()
+                            != frontmatter_title.lower()):
+            return body
 
-        return body
+        # Slice out the H1 line and any immediately following empty lines
+        line_end = content.find('\n', h1_match.end())
+        if line_end == -1:
+            return content[:max(h1_match.start() - 1, 0)]
+        rest = content[line_end + 1:]
+        return content[:h1_match.start()] + rest[_BLANK_LINES_RE.match(rest).end():]
 
     def _convert_internal_links(self, content: str, source_file: Path) -> str:
         """Convert internal links to Hugo format"""
-        # Pattern for markdown links - handle multi-line links
-        link_pattern = r'\[([^\]]+)\]\(([^)]+)\)'
+        # Directory of this page relative to the source root
+        # (work/bazel-source/site/en), shared by all its relative links
+        rel_source_dir = None
+        for parent in source_file.parents:
+            if parent.name == 'en' and parent.parent.name == 'site':
+                rel_source_dir = source_file.parent.relative_to(parent)
+                break
 
         def replace_link(match):
             link_text = match.group(1)
             link_url = match.group(2)
 
-            # Clean up any whitespace and newlines in the URL
-            link_url = re.sub(r'\s+', '', link_url)
+            # Clean up any whitespace and newlines in the URL (str.split()
+            # splits on exactly the characters \s matches, without regex setup)
+            link_url = ''.join(link_url.split())
 
             # Skip external links
-            if link_url.startswith(
-                ('http://', 'https://', 'mailto:', 'tel:', 'ftp://')):
+            if link_url.startswith(_EXTERNAL_SCHEMES):
                 return match.group(0)
 
             # Skip anchor links
@@ -406,8 +550,7 @@ class DevsiteToHugoConverter:
 
             # Handle external API links (absolute paths to external documentation)
             if link_url.startswith('/') and self._should_redirect_to_external(link_url):
-                external_base = self.config.get('external_links', {}).get('bazel_api_base', 'https://bazel.build')
-                return f'[{link_text}]({external_base}{link_url})'
+                return f'[{link_text}]({self._external_base}{link_url})'
 
             # Handle relative links to .md files
             if link_url.endswith('.md') or '.md#' in link_url:
@@ -424,22 +567,9 @@ class DevsiteToHugoConverter:
 
                 # Handle relative paths by resolving against source file location
                 if not normalized_path.startswith('/'):
-                    # Get the source file's directory relative to the source root
-                    source_dir = source_file.parent
-                    # Find the source root (work/bazel-source/site/en)
-                    source_root = None
-                    for parent in source_file.parents:
-                        if parent.name == 'en' and parent.parent.name == 'site':
-                            source_root = parent
-                            break
-
-                    if source_root:
-                        # Get relative directory from source root
-                        rel_source_dir = source_dir.relative_to(source_root)
-
+                    if rel_source_dir is not None:
                         # Remove leading './' if present
-                        if normalized_path.startswith('./'):
-                            normalized_path = normalized_path[2:]
+                        normalized_path = normalized_path.removeprefix('./')
 
                         # Resolve relative path
                         if str(rel_source_dir) == '.':
@@ -453,45 +583,40 @@ class DevsiteToHugoConverter:
                         path_parts = full_path.split('/')
                         if path_parts:
                             section_name = path_parts[0]
-                            if section_name in self.config.get('content_mapping', {}):
-                                mapping = self.config['content_mapping'][section_name]
+                            mapping = self._content_mapping.get(section_name)
+                            if mapping is not None:
                                 category_type = mapping['type']
                                 return f'[{link_text}](/{category_type}/{full_path}/{anchor})'
                             else:
                                 return f'[{link_text}]({full_path}/{anchor})'
 
                 # Remove leading '/' if present (absolute paths within site)
-                if normalized_path.startswith('/'):
-                    normalized_path = normalized_path[1:]
+                normalized_path = normalized_path.removeprefix('/')
 
                 # Use simple relative links to avoid shortcode issues
                 return f'[{link_text}](/{normalized_path}/{anchor})'
 
             # Handle relative links to directories (assume they have index pages)
-            if '/' in link_url and not '.' in link_url.split('/')[-1]:
+            if '/' in link_url and '.' not in link_url.rpartition('/')[2]:
                 # This looks like a directory link, convert to Hugo section link
-                normalized_path = link_url.rstrip('/')
-                if normalized_path.startswith('./'):
-                    normalized_path = normalized_path[2:]
-                if normalized_path.startswith('/'):
-                    normalized_path = normalized_path[1:]
+                normalized_path = link_url.rstrip('/').removeprefix('./').removeprefix('/')
 
                 return f'[{link_text}](/{normalized_path}/)'
 
             # Return original for other cases (images, other assets, etc.)
             return match.group(0)
 
-        return re.sub(link_pattern, replace_link, content, flags=re.DOTALL)
+        return _LINK_RE.sub(replace_link, content)
 
     def _should_redirect_to_external(self, link_url: str) -> bool:
         """Check if a link should be redirected to external Bazel API docs"""
-        external_paths = self.config.get('external_links', {}).get('external_paths', [])
-        return any(link_url.startswith(path) for path in external_paths)
+        return link_url.startswith(self._external_paths)
 
     def _fix_directory_structures(self, content: str) -> str:
         """Fix directory structure formatting to use proper code blocks"""
-        # Pattern to match directory structures with Unicode tree characters
-        tree_pattern = r'(following directory structure:?\s*(?:\n|```?)?\s*)(└.*?(?:\n.*?[├└│].*?)*)'
+        # Both tree patterns start at a '└'; most pages have none
+        if '└' not in content:
+            return content
 
         def replace_tree(match):
             intro = match.group(1).strip()
@@ -500,14 +625,9 @@ class DevsiteToHugoConverter:
             # Use plain text code block without syntax highlighting
             return f"{intro}\n\n```text\n{tree_content}\n```"
 
-        content = re.sub(tree_pattern,
-                         replace_tree,
-                         content,
-                         flags=re.DOTALL | re.MULTILINE)
+        content = _TREE_RE.sub(replace_tree, content)
 
         # Also handle cases where tree structures are inline without proper formatting
-        inline_tree_pattern = r'(```\s*)(└.*?(?:\n.*?[├└│].*?)*)(```)'
-
         def fix_inline_tree(match):
             start = "```text"
             tree_content = match.group(2)
@@ -518,10 +638,7 @@ class DevsiteToHugoConverter:
 
             return f"{start}\n{tree_content}\n{end}"
 
-        content = re.sub(inline_tree_pattern,
-                         fix_inline_tree,
-                         content,
-                         flags=re.DOTALL)
+        content = _INLINE_TREE_RE.sub(fix_inline_tree, content)
 
         return content
 
@@ -540,58 +657,27 @@ class DevsiteToHugoConverter:
              Content with unlabeled code blocks annotated with language
              identifiers.
          """
-         # Fetch language detection patterns from configuration, or use
-         # sensible defaults.  Keys are language names, values are
-         # sequences of substrings indicative of that language.
-         language_patterns: Dict[str, List[str]] = self.config.get('code_language_patterns')
-
-         def determine_language(code_content: str) -> str:
-             """Return the best language guess for a code snippet.
-
-             This helper inspects the provided code content for the
-             presence of known substrings.  The first matching language
-             wins.  If no patterns match, ``text`` is returned.
-
-             Parameters
-             ----------
-             code_content : str
-                 Raw code content extracted from a fenced code block.
-
-             Returns
-             -------
-             str
-                 Name of the detected language or ``'text'`` when
-                 uncertain.
-             """
-             if not code_content or not code_content.strip():
-                 return 'text'
-             # Treat directory structures as plain text (these may use
-             # ASCII/Unicode tree characters or start with a leading slash).
-             stripped_content = code_content.strip()
-             if stripped_content.startswith('/') or any(
-                 char in code_content for char in ('└', '├', '│')
-             ):
-                 return 'text'
-             # Check each configured language pattern in the order they
-             # appear.  The first match determines the language.
-             for language, patterns in language_patterns.items():
-                 for pattern in patterns:
-                     if pattern in code_content:
-                         return language
-             return 'text'
-
-         # Split the content into lines, preserving line endings so we
-         # can reconstruct the document accurately.
-         lines: List[str] = content.splitlines(keepends=True)
          result: List[str] = []
          in_code_block = False
          in_unlabeled_block = False
          code_lines: List[str] = []
          fence_indent: str = ''
 
-         idx = 0
-         while idx < len(lines):
-             line = lines[idx]
+         if '```' not in content:
+             return content
+
+         # Walk the lines, preserving line endings so we can reconstruct
+         # the document accurately.
+         for line in content.splitlines(keepends=True):
+             # Lines without a fence marker never change state, so route
+             # them to the current block without stripping them first
+             if '```' not in line:
+                 if in_unlabeled_block:
+                     code_lines.append(line)
+                 else:
+                     result.append(line)
+                 continue
+
              stripped = line.strip()
              # Detect the start of a code fence when not already in a block
              if not in_code_block:
@@ -622,7 +708,7 @@ class DevsiteToHugoConverter:
                      if in_unlabeled_block:
                          # Compute the language and emit annotated fence
                          code_content = ''.join(code_lines).rstrip('\n\r')
-                         language = determine_language(code_content)
+                         language = self._determine_language(code_content)
                          result.append(f'{fence_indent}```{language}\n')
                          if code_content:
                              result.append(code_content + '\n')
@@ -641,13 +727,12 @@ class DevsiteToHugoConverter:
                          code_lines.append(line)
                      else:
                          result.append(line)
-             idx += 1
 
          # Handle unterminated unlabeled blocks at EOF.  If the file ends
          # inside an unlabeled code block, annotate it anyway.
          if in_code_block and in_unlabeled_block:
              code_content = ''.join(code_lines).rstrip('\n\r')
-             language = determine_language(code_content)
+             language = self._determine_language(code_content)
              result.append(f'{fence_indent}```{language}\n')
              if code_content:
                  result.append(code_content + '\n')
@@ -655,36 +740,184 @@ class DevsiteToHugoConverter:
 
          return ''.join(result)
 
+    def _determine_language(self, code_content: str) -> str:
+        """Return the best language guess for a code snippet.
+
+        This helper inspects the provided code content for the
+        presence of the substrings configured under
+        ``code_language_patterns``.  The first matching language wins.
+        If no patterns match, ``text`` is returned.
+
+        Parameters
+        ----------
+        code_content : str
+            Raw code content extracted from a fenced code block.
+
+        Returns
+        -------
+        str
+            Name of the detected language or ``'text'`` when
+            uncertain.
+        """
+        if not code_content or not code_content.strip():
+            return 'text'
+        # Treat directory structures as plain text (these may use
+        # ASCII/Unicode tree characters or start with a leading slash).
+        stripped_content = code_content.strip()
+        if stripped_content.startswith('/') or any(
+            char in code_content for char in ('└', '├', '│')
+        ):
+            return 'text'
+        # Check each configured language pattern in the order they
+        # appear.  The first match determines the language.
+        for language, pattern in self._language_patterns:
+            if pattern in code_content:
+                return language
+        return 'text'
+
     def _generate_hugo_markdown(self, frontmatter: Dict, body: str) -> str:
         """Generate Hugo markdown file with frontmatter and body"""
         # Convert frontmatter to YAML
-        frontmatter_yaml = yaml.dump(frontmatter, default_flow_style=False)
+        frontmatter_yaml = self._emit_frontmatter(frontmatter)
 
         return f"---\n{frontmatter_yaml}---\n\n{body}"
 
-    def _file_needs_conversion(self, source_file: Path,
-                               output_file: Path) -> bool:
-        """Check if file needs conversion (for incremental updates)"""
-        if not output_file.exists():
-            return True
+    def _emit_frontmatter(self, frontmatter: Dict) -> str:
+        """Serialize frontmatter as YAML
 
-        # Compare modification times
-        return source_file.stat().st_mtime > output_file.stat().st_mtime
+        Pages only carry a few flat scalar fields, which are written
+        directly and match yaml.dump byte for byte. Lists, floats and
+        strings that need quoting or folding fall back to the libyaml
+        dumper for the whole mapping; that text loads back to the same
+        data but may quote or fold differently from yaml.dump.
+        """
+        lines = []
+        for key in sorted(frontmatter):
+            value = frontmatter[key]
+            if isinstance(value, bool):
+                scalar = 'true' if value else 'false'
+            elif isinstance(value, int):
+                scalar = str(value)
+            elif value is None:
+                scalar = 'null'
+            elif (isinstance(value, str) and _PLAIN_YAML_RE.fullmatch(value)
+                  and value not in _YAML_RESERVED_WORDS):
+                scalar = value
+            else:
+                break
+            line = f"{key}: {scalar}\n"
+            if (not isinstance(key, str) or not _PLAIN_YAML_RE.fullmatch(key)
+                    or key in _YAML_RESERVED_WORDS
+                    or len(line) > _YAML_LINE_WIDTH):
+                break
+            lines.append(line)
+        else:
+            return ''.join(lines) or '{}\n'
+
+        return yaml.dump(frontmatter, Dumper=SafeDumper, default_flow_style=False)
+
+    def _file_needs_conversion(self, source_file: Path, output_file: Path,
+                               cached_entry: Optional[Dict]) -> Tuple[bool, Dict]:
+        """
+        Check if file needs conversion (for incremental updates)
 
-    def _convert_assets(self, source_path: str, output_path: str) -> None:
+        Source content is hashed rather than compared by mtime, so a git
+        checkout that only touches timestamps does not force reconversion;
+        the hash is skipped when mtime and size still match the cache.
+
+        Returns:
+            Whether to convert the file, and its cache entry (SHA-256
+            digest, mtime and size)
+        """
+        stat = source_file.stat()
+        output_exists = output_file.exists()
+        if (cached_entry and output_exists
+                and cached_entry.get('mtime_ns') == stat.st_mtime_ns
+                and cached_entry.get('size') == stat.st_size):
+            return False, cached_entry
+
+        entry = self._source_cache_entry(source_file, stat)
+        cached_digest = cached_entry.get('digest') if cached_entry else None
+        return entry['digest'] != cached_digest or not output_exists, entry
+
+    def _source_cache_entry(self, source_file: Path, stat: os.stat_result) -> Dict:
+        """Build the conversion cache entry for a source file's current content"""
+        digest = hashlib.sha256(source_file.read_bytes()).hexdigest()
+        return {'digest': digest, 'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+
+    def _load_conversion_cache(self, output_dir: Path) -> Dict[str, Dict]:
+        """Load source digests recorded by the previous incremental run"""
+        cache_file = output_dir / CONVERSION_CACHE_FILE
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable conversion cache {cache_file}: {e}")
+            return {}
+        if not isinstance(cache, dict):
+            return {}
+        # Caches from before mtime/size were recorded map straight to a
+        # digest; keep using them, the hash check still applies
+        return {key: entry if isinstance(entry, dict) else {'digest': entry}
+                for key, entry in cache.items()}
+
+    def _save_conversion_cache(self, output_dir: Path, cache: Dict[str, Dict]) -> None:
+        """Atomically replace the conversion cache"""
+        cache_file = output_dir / CONVERSION_CACHE_FILE
+        tmp_file = output_dir / f'{CONVERSION_CACHE_FILE}.tmp'
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, indent=2, sort_keys=True)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            logger.warning(f"Could not write conversion cache {cache_file}: {e}")
+
+    def _convert_assets(self, source_path: str, output_path: str,
+                        source_files: Dict[str, List[Path]]) -> None:
         """Convert static assets"""
         source_dir = Path(source_path)
         output_dir = Path(output_path)
 
         # Copy static assets (images, etc.)
         static_extensions = ['.png', '.jpg', '.jpeg', '.gif', '.svg', '.ico']
-        for ext in static_extensions:
-            for asset_file in source_dir.rglob(f'*{ext}'):
-                relative_path = asset_file.relative_to(source_dir)
-                output_asset = output_dir / 'static' / relative_path
-                output_asset.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(asset_file, output_asset)
-                logger.debug(f"Copied asset: {asset_file} -> {output_asset}")
+        asset_files = [asset_file for ext in static_extensions
+                       for asset_file in source_files.get(ext, [])]
+        for asset_file in asset_files:
+            relative_path = asset_file.relative_to(source_dir)
+            output_asset = output_dir / 'static' / relative_path
+            if self._asset_up_to_date(asset_file, output_asset):
+                logger.debug(f"Asset unchanged, skipping: {asset_file}")
+                continue
+            self._ensure_dir(output_asset.parent)
+            shutil.copyfile(asset_file, output_asset)
+            logger.debug(f"Copied asset: {asset_file} -> {output_asset}")
+
+    def _asset_up_to_date(self, source_file: Path, output_file: Path) -> bool:
+        """Check whether output_file is a copy of source_file made after its last change"""
+        try:
+            output_stat = output_file.stat()
+        except OSError:
+            return False
+        source_stat = source_file.stat()
+        return (output_stat.st_size == source_stat.st_size
+                and output_stat.st_mtime_ns >= source_stat.st_mtime_ns)
+
+    def _collect_source_files(self, source_dir: Path) -> Dict[str, List[Path]]:
+        """Walk source_dir once and group its files by extension"""
+        source_files: Dict[str, List[Path]] = {}
+        for dirpath, _dirnames, filenames in os.walk(source_dir):
+            for filename in filenames:
+                ext = os.path.splitext(filename)[1]
+                source_files.setdefault(ext, []).append(Path(dirpath, filename))
+        return source_files
+
+    def _ensure_dir(self, directory: Path) -> None:
+        """Create directory and its parents, skipping ones already created"""
+        if directory not in self._created_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(directory)
 
     def _generate_hugo_config(self, output_path: str) -> None:
         """Generate Hugo configuration file"""
@@ -716,3 +949,18 @@ class DevsiteToHugoConverter:
 
         logger.info("Validation passed")
         return True
+
+
+# Converter used by a worker process of _convert_content_files
+_worker_converter: Optional[DevsiteToHugoConverter] = None
+
+
+def _init_worker(config_path: str) -> None:
+    """Build the converter once per worker process"""
+    global _worker_converter
+    _worker_converter = DevsiteToHugoConverter(config_path)
+
+
+def _convert_in_worker(task: Tuple) -> Tuple[str, Optional[Dict]]:
+    """Convert one content file in a worker process"""
+    return _worker_converter._convert_content_file(*task)
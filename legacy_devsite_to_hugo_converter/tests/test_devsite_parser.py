@@ -0,0 +1,59 @@
+"""
+Tests for the Devsite structure parser
+Run from legacy_devsite_to_hugo_converter with: python -m unittest discover tests
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+CONVERTER_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(CONVERTER_DIR))
+
+from utils.devsite_parser import _TITLE_READ_SIZE, DevsiteParser  # noqa: E402
+
+
+class ExtractTitleTest(unittest.TestCase):
+    """Reading a page's title from its frontmatter or first H1"""
+
+    def setUp(self):
+        self.parser = DevsiteParser({})
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.page = Path(tmp.name) / 'some-page.md'
+
+    def title(self, content: str) -> str:
+        self.page.write_text(content, encoding='utf-8')
+        return self.parser._extract_title_from_file(self.page)
+
+    def test_frontmatter_closed_after_first_read(self):
+        filler = 'description: ' + 'x' * _TITLE_READ_SIZE + '\n'
+        content = '---\n' + filler + 'title: Late\n---\n# Heading\n'
+        self.assertEqual(self.title(content), 'Late')
+
+    def test_h1_cut_at_read_boundary(self):
+        # Only '# Hea' fits in the first read
+        content = 'x' * (_TITLE_READ_SIZE - 6) + '\n# Heading\n'
+        self.assertEqual(self.title(content), 'Heading')
+
+    def test_file_exactly_one_read_long(self):
+        content = '# Heading\n'
+        content += 'x' * (_TITLE_READ_SIZE - len(content))
+        self.assertEqual(len(content), _TITLE_READ_SIZE)
+        self.assertEqual(self.title(content), 'Heading')
+
+    def test_h1_ending_file_exactly_one_read_long(self):
+        content = 'x' * (_TITLE_READ_SIZE - len('\n# Heading')) + '\n# Heading'
+        self.assertEqual(self.title(content), 'Heading')
+
+    def test_null_frontmatter_title_is_returned(self):
+        # A title key wins over the H1 even when its value is null
+        self.assertIsNone(self.title('---\ntitle:\n---\n# Heading\n'))
+
+    def test_frontmatter_read_as_scalar_falls_back_to_h1(self):
+        self.assertEqual(self.title('---\ntitle\t\n---\n# Heading\n'), 'Heading')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,179 @@
+"""
+Tests for the Devsite to Hugo converter
+Run from legacy_devsite_to_hugo_converter with: python -m unittest discover tests
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import yaml
+
+CONVERTER_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(CONVERTER_DIR))
+
+from devsite_to_hugo_converter import DevsiteToHugoConverter  # noqa: E402
+
+
+class ConvertBodyContentTest(unittest.TestCase):
+    """Removal of Devsite-only markup from page bodies"""
+
+    def setUp(self):
+        self.converter = DevsiteToHugoConverter(str(CONVERTER_DIR / 'config.yaml'))
+
+    def convert(self, body: str) -> str:
+        return self.converter._convert_body_content(body, Path('docs/page.md'))
+
+    def test_mathjax_opened_on_book_line_is_removed_whole(self):
+        body = 'Book: x <devsite-mathjax>\nbody\n</devsite-mathjax>\nkeep\n'
+        self.assertEqual(self.convert(body), 'keep')
+
+    def test_mathjax_opened_on_project_line_is_removed_whole(self):
+        body = 'Project: /_project.yaml <devsite-mathjax config="x">\n$$a$$\n</devsite-mathjax>\nkeep\n'
+        self.assertEqual(self.convert(body), 'keep')
+
+    def test_book_line_is_matched_after_toc_removal(self):
+        # ^ applies to the text left once [TOC] is gone
+        self.assertEqual(self.convert('x\n[TOC]Book: y\n'), 'x')
+
+    def test_project_line_is_matched_after_include_removal(self):
+        body = 'x\n{% include "_buttons.html" %}Project: /_project.yaml\nkeep\n'
+        self.assertEqual(self.convert(body), 'x\n\nkeep')
+
+
+class ParseMarkdownFileTest(unittest.TestCase):
+    """Splitting a page into frontmatter and body"""
+
+    def setUp(self):
+        self.converter = DevsiteToHugoConverter(str(CONVERTER_DIR / 'config.yaml'))
+
+    def parse(self, content: str):
+        with self.assertLogs('devsite_to_hugo_converter', 'WARNING'):
+            return self.converter._parse_markdown_file(content)
+
+    def test_frontmatter_read_as_scalar_is_dropped(self):
+        self.assertEqual(self.parse('---\né{%\t\ntext line\n---\n# Page\n'),
+                         ({}, '# Page\n'))
+
+    def test_frontmatter_read_as_list_is_dropped(self):
+        self.assertEqual(self.parse('---\n- a\n- b\n---\nBody\n'), ({}, 'Body\n'))
+
+
+class EmitFrontmatterTest(unittest.TestCase):
+    """Frontmatter serialization against yaml.dump"""
+
+    VALUES = [
+        'Getting started', 'Yes', 'null', 'on', 'Off', 'NULL', 'trailing ',
+        "it's", 'a, b', 'a: b', 'a #b', '#a', "'quoted'", '', ' leading',
+        '1.0', '~', 'é', 0, -3, 10 ** 20, True, False, None, 1.5,
+        float('inf'), ['a', 'b'],
+    ]
+
+    def setUp(self):
+        self.converter = DevsiteToHugoConverter(str(CONVERTER_DIR / 'config.yaml'))
+
+    def assertMatchesYamlDump(self, frontmatter: dict):
+        with self.subTest(frontmatter=frontmatter):
+            self.assertEqual(self.converter._emit_frontmatter(frontmatter),
+                             yaml.dump(frontmatter, default_flow_style=False))
+
+    def test_scalar_values(self):
+        for value in self.VALUES:
+            self.assertMatchesYamlDump({'title': value, 'book_path': '/_book.yaml'})
+
+    def test_scalar_keys(self):
+        for key in ('Yes', 'on', 'null', 'trailing ', 'a: b', '#a', 'toc'):
+            self.assertMatchesYamlDump({key: 'value', 'title': 'Page'})
+
+    def test_values_around_fold_width(self):
+        # 'title: ' plus the value on either side of the 80 column limit
+        for width in (79, 80, 81, 82):
+            length = width - len('title: ')
+            self.assertMatchesYamlDump({'title': ('word ' * 20)[:length - 1] + 'x'})
+            self.assertMatchesYamlDump({'title': 'x' * length})
+
+    def test_fallback_loads_back_to_same_data(self):
+        # libyaml writes an empty key inline where yaml.dump uses '? '
+        frontmatter = {'': 'v', 'title': ''}
+        self.assertEqual(yaml.safe_load(self.converter._emit_frontmatter(frontmatter)),
+                         frontmatter)
+
+
+class ConvertContentFilesTest(unittest.TestCase):
+    """Per-file error handling while converting content"""
+
+    def setUp(self):
+        self.converter = DevsiteToHugoConverter(str(CONVERTER_DIR / 'config.yaml'))
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.source_dir = Path(tmp.name) / 'source'
+        self.output_dir = Path(tmp.name) / 'output'
+
+        good = self.source_dir / 'tutorials' / 'good.md'
+        good.parent.mkdir(parents=True)
+        good.write_text('# Good\n\nBody\n', encoding='utf-8')
+
+        # content_mapping's enable_category_indices flag is not a section
+        # mapping, so looking up a category for this page raises TypeError
+        bad = self.source_dir / 'enable_category_indices' / 'bad.md'
+        bad.parent.mkdir(parents=True)
+        bad.write_text('# Bad\n', encoding='utf-8')
+
+        self.source_files = {'.md': [good, bad]}
+
+    def convert(self, jobs: int) -> dict:
+        return self.converter._convert_content_files(
+            str(self.source_dir), str(self.output_dir), self.source_files,
+            dry_run=False, incremental=False, jobs=jobs)
+
+    def test_bad_file_is_counted_as_error(self):
+        stats = self.convert(jobs=1)
+        self.assertEqual(stats['error_files'], 1)
+        self.assertEqual(stats['converted_files'], 1)
+
+    def test_bad_file_in_worker_process_is_counted_as_error(self):
+        stats = self.convert(jobs=2)
+        self.assertEqual(stats['error_files'], 1)
+        self.assertEqual(stats['converted_files'], 1)
+
+
+class IncrementalConversionTest(unittest.TestCase):
+    """The conversion cache shared by full and incremental runs"""
+
+    def setUp(self):
+        self.converter = DevsiteToHugoConverter(str(CONVERTER_DIR / 'config.yaml'))
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.source_dir = Path(tmp.name) / 'source'
+        self.output_dir = Path(tmp.name) / 'output'
+        self.page = self.source_dir / 'tutorials' / 'page.md'
+        self.page.parent.mkdir(parents=True)
+
+    def convert(self, incremental: bool) -> dict:
+        return self.converter._convert_content_files(
+            str(self.source_dir), str(self.output_dir), {'.md': [self.page]},
+            dry_run=False, incremental=incremental, jobs=1)
+
+    def test_full_run_refreshes_cache_for_later_incremental_run(self):
+        self.page.write_text('# A\n', encoding='utf-8')
+        self.assertEqual(self.convert(incremental=True)['converted_files'], 1)
+
+        self.page.write_text('# Page B\n', encoding='utf-8')
+        self.assertEqual(self.convert(incremental=False)['converted_files'], 1)
+
+        # Reverting to the content the incremental run saw must not be
+        # mistaken for the output now on disk
+        self.page.write_text('# A\n', encoding='utf-8')
+        stats = self.convert(incremental=True)
+        self.assertEqual(stats['converted_files'], 1)
+        self.assertEqual(stats['skipped_files'], 0)
+
+    def test_incremental_run_after_full_run_skips_unchanged_file(self):
+        self.page.write_text('# A\n', encoding='utf-8')
+        self.convert(incremental=False)
+        self.assertEqual(self.convert(incremental=True)['skipped_files'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,13 +3,26 @@ Devsite Parser Module
 Handles parsing of Google Devsite documentation structure
 """
 
+import os
 import yaml
 import logging
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
+# Prefer the libyaml-backed loader; it parses the same documents much faster
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 logger = logging.getLogger(__name__)
 
+# Characters read from a page before looking for its title
+_TITLE_READ_SIZE = 4096
+
+# Returned by _find_title when a page's title is not known yet
+_NO_TITLE = object()
+
 class DevsiteParser:
     """Parser for Google Devsite documentation structure"""
     
@@ -61,7 +74,7 @@ class DevsiteParser:
         
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=SafeLoader)
                 logger.debug(f"Parsed book config: {file_path}")
                 return config or {}
         except Exception as e:
@@ -76,7 +89,7 @@ class DevsiteParser:
         
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=SafeLoader)
                 logger.debug(f"Parsed index config: {file_path}")
                 return config or {}
         except Exception as e:
@@ -116,49 +129,71 @@ class DevsiteParser:
         if section_index.exists():
             section_info['config']['index'] = self._parse_index_yaml(section_index)
         
-        # Scan for markdown files
-        for md_file in section_dir.rglob('*.md'):
-            relative_path = md_file.relative_to(section_dir)
-            file_info = {
-                'path': str(md_file),
-                'relative_path': str(relative_path),
-                'name': md_file.name,
-                'title': self._extract_title_from_file(md_file)
-            }
-            section_info['files'].append(file_info)
-        
-        # Scan for subsections
-        for item in section_dir.iterdir():
-            if item.is_dir() and not item.name.startswith('.'):
-                subsection_info = self._analyze_section(item)
-                if subsection_info:
-                    section_info['subsections'][item.name] = subsection_info
+        # Scan for markdown files and subsections
+        section_info['files'] = self._scan_section_tree(section_dir, section_info['subsections'])
         
         return section_info
+
+    def _scan_section_tree(self, directory: Path, subsections: Optional[Dict]) -> List[Dict]:
+        """
+        Collect every markdown file under a directory in a single walk
+
+        Non-hidden child directories are analyzed as subsections (when
+        subsections is given) and their files are reused here, so each
+        file is listed and read once however deep it is. Files keep the
+        rglob('*.md') order and contents: this directory's files first,
+        then each real child directory's, hidden ones included and
+        directory symlinks not followed.
+        """
+        with os.scandir(directory) as scandir_it:
+            entries = list(scandir_it)
+
+        files = []
+        for entry in entries:
+            if entry.name.endswith('.md'):
+                md_file = directory / entry.name
+                files.append({
+                    'path': str(md_file),
+                    'relative_path': entry.name,
+                    'name': entry.name,
+                    'title': self._extract_title_from_file(md_file)
+                })
+
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            child_dir = directory / entry.name
+            if subsections is not None and not entry.name.startswith('.'):
+                subsection_info = self._analyze_section(child_dir)
+                if subsection_info:
+                    subsections[entry.name] = subsection_info
+                nested_files = subsection_info['files']
+            elif not entry.is_symlink():
+                nested_files = self._scan_section_tree(child_dir, None)
+            else:
+                continue
+
+            if not entry.is_symlink():
+                files.extend(dict(file_info, relative_path=os.path.join(entry.name, file_info['relative_path']))
+                             for file_info in nested_files)
+
+        return files
     
     def _extract_title_from_file(self, file_path: Path) -> str:
         """Extract title from markdown file"""
         try:
+            # Titles sit at the top of the page, so read the rest of the
+            # file only when the first chunk does not settle it
             with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+                content = f.read(_TITLE_READ_SIZE)
+                complete = len(content) < _TITLE_READ_SIZE
+                title = self._find_title(content, complete)
+                if title is _NO_TITLE and not complete:
+                    content += f.read()
+                    title = self._find_title(content, True)
             
-            # Look for YAML frontmatter title
-            if content.startswith('---\n'):
-                end_pos = content.find('\n---\n', 4)
-                if end_pos != -1:
-                    frontmatter_content = content[4:end_pos]
-                    try:
-                        frontmatter = yaml.safe_load(frontmatter_content)
-                        if frontmatter and 'title' in frontmatter:
-                            return frontmatter['title']
-                    except yaml.YAMLError:
-                        pass
-            
-            # Look for first H1 heading
-            lines = content.split('\n')
-            for line in lines:
-                if line.startswith('# '):
-                    return line[2:].strip()
+            if title is not _NO_TITLE:
+                return title
             
             # Fallback to filename
             return file_path.stem.replace('-', ' ').replace('_', ' ').title()
@@ -167,6 +202,44 @@ class DevsiteParser:
             logger.debug(f"Could not extract title from {file_path}: {e}")
             return file_path.stem.replace('-', ' ').replace('_', ' ').title()
     
+    def _find_title(self, content: str, complete: bool) -> Any:
+        """
+        Find the frontmatter title or first H1 heading in content
+        
+        Args:
+            content: Start of the file, or all of it when complete is True
+            complete: Whether content holds the whole file
+            
+        Returns:
+            The title, or _NO_TITLE if content does not contain one or
+            more of the file is needed to tell
+        """
+        # Look for YAML frontmatter title
+        if content.startswith('---\n'):
+            end_pos = content.find('\n---\n', 4)
+            if end_pos == -1 and not complete:
+                return _NO_TITLE
+            if end_pos != -1:
+                frontmatter_content = content[4:end_pos]
+                # Frontmatter without a title key cannot yield one, so
+                # skip the YAML parse for it
+                if 'title' in frontmatter_content:
+                    try:
+                        frontmatter = yaml.load(frontmatter_content, Loader=SafeLoader)
+                        if isinstance(frontmatter, dict) and 'title' in frontmatter:
+                            return frontmatter['title']
+                    except yaml.YAMLError:
+                        pass
+        
+        # Look for first H1 heading, ignoring a trailing partial line
+        if not complete:
+            content = content[:content.rfind('\n') + 1]
+        for line in content.split('\n'):
+            if line.startswith('# '):
+                return line[2:].strip()
+        
+        return _NO_TITLE
+    
     def _extract_sections(self, content_structure: Dict) -> List[Dict]:
         """Extract section information for Hugo mapping"""
         sections = []
@@ -3,11 +3,11 @@ Hugo Generator Module
 Handles generation of Hugo site structure and configuration
 """
 
-import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, List, Optional
-import yaml
+from typing import Dict, List, NamedTuple, Tuple
 from jinja2 import Environment, FileSystemLoader
 
 logger = logging.getLogger(__name__)
@@ -17,13 +17,65 @@ HOW_TO_GUIDES_DESCRIPTION = 'Guides for specific tasks and issues your will enco
 EXPLANATIONS_DESCRIPTION = 'Understanding Bazel concepts and features'
 REFERENCE_DESCRIPTION = 'Reference materials, API documentation, and good information for rules authors'
 
+# Turns subsection directory names into titles, e.g. 'remote-cache'
+_DASH_TO_SPACE = str.maketrans('-', ' ')
+
+# Top-level content categories, keyed by the content_mapping type
+CATEGORIES = {
+    'tutorials': {
+        'title': 'Tutorials',
+        'description': TUTORIALS_DESCRIPTION,
+        'weight': 1,
+    },
+    'how-to-guides': {
+        'title': 'How-To Guides',
+        'description': HOW_TO_GUIDES_DESCRIPTION,
+        'weight': 2,
+    },
+    'explanations': {
+        'title': 'Explanations',
+        'description': EXPLANATIONS_DESCRIPTION,
+        'weight': 3,
+    },
+    'reference': {
+        'title': 'Reference',
+        'description': REFERENCE_DESCRIPTION,
+        'weight': 4,
+    },
+}
+
+class _Subsection(NamedTuple):
+    """One entry in an index's subsections list"""
+    title: str
+    path: str
+    description: str
+
 class HugoGenerator:
     """Generator for Hugo site structure and configuration"""
     
     def __init__(self, config: Dict):
         """Initialize generator with configuration"""
         self.config = config
-        self.template_env = Environment(loader=FileSystemLoader('templates'))
+        # Content type of each mapped section, so lookups are a single get
+        self._section_types = {
+            section_name: mapping['type']
+            for section_name, mapping in config.get('content_mapping', {}).items()
+            if isinstance(mapping, dict) and 'type' in mapping
+        }
+        # Templates do not change during a run, so skip the per-render
+        # up-to-date check against the filesystem
+        self.template_env = Environment(loader=FileSystemLoader('templates'),
+                                        auto_reload=False)
+
+    @cached_property
+    def hugo_config_template(self):
+        """Template for hugo.yaml, loaded on first use"""
+        return self.template_env.get_template('hugo_config.yaml.jinja2')
+
+    @cached_property
+    def section_index_template(self):
+        """Template shared by every _index.md, loaded on first use"""
+        return self.template_env.get_template('section_index.jinja2')
         
     def generate_config(self, output_path: str) -> bool:
         """
@@ -38,17 +90,11 @@ class HugoGenerator:
         """
         try:
             output_dir = Path(output_path)
-                        
-            with open(Path('config.yaml'), 'r') as f:
-                context = yaml.safe_load(f)
-            # Render Hugo configuration
-            template = self.template_env.get_template('hugo_config.yaml.jinja2')
-            config_content = template.render(context)
             
-            # Write configuration file
+            # Render Hugo configuration from the already loaded config
+            # straight into the configuration file
             config_file = output_dir / 'hugo.yaml'
-            with open(config_file, 'w', encoding='utf-8') as f:
-                f.write(config_content)
+            self.hugo_config_template.stream(self.config).dump(str(config_file), encoding='utf-8')
             
             logger.info(f"Generated Hugo configuration: {config_file}")
             return True
@@ -71,13 +117,22 @@ class HugoGenerator:
         try:
             output_dir = Path(output_path)
             content_dir = output_dir / 'content'
+
+            # Create every index directory up front, parents first
+            self._create_index_directories(content_dir, devsite_structure)
+            
+            # Prepare every index first, collecting (path, context) pairs
+            index_files = []
             
             # Generate main index
-            self._generate_main_index(content_dir, devsite_structure)
+            self._generate_main_index(content_dir, devsite_structure, index_files)
             
             # Generate section indices
             for section in devsite_structure['sections']:
-                self._generate_section_index(content_dir, section)
+                self._generate_section_index(content_dir, section, index_files)
+            
+            # The files are independent, so let their renders and writes overlap
+            self._write_index_files(index_files)
             
             logger.info("Generated section index files")
             return True
@@ -86,95 +141,87 @@ class HugoGenerator:
             logger.error(f"Failed to generate section indices: {e}")
             return False
     
-    def _generate_main_index(self, content_dir: Path, devsite_structure: Dict) -> None:
+    def _create_index_directories(self, content_dir: Path, devsite_structure: Dict) -> None:
+        """Create the content, category, section and subsection directories in one pass"""
+        content_dir.mkdir(parents=True, exist_ok=True)
+
+        directories = set()
+        if self.config.get('content_mapping').get('enable_category_indices'):
+            directories.update(content_dir / category_type
+                               for category_type in CATEGORIES)
+        for section in devsite_structure['sections']:
+            category_type = self._section_types.get(section['name'])
+            if category_type is None:
+                # _generate_section_index reports unmapped sections
+                continue
+            category_dir = content_dir / category_type
+            section_dir = category_dir / section['name']
+            directories.add(category_dir)
+            directories.add(section_dir)
+            directories.update(section_dir / subsection_name
+                               for subsection_name in section['subsections'])
+
+        # Shallower paths first, so each parent exists before its children
+        for directory in sorted(directories, key=lambda path: len(path.parts)):
+            directory.mkdir(exist_ok=True)
+
+    def _write_index_files(self, index_files: List[Tuple[Path, Dict]]) -> None:
+        """Render and write index files using a thread pool"""
+        with ThreadPoolExecutor() as executor:
+            # Consume the results so a failed write is raised here
+            list(executor.map(self._write_index_file, index_files))
+    
+    def _write_index_file(self, index_file: Tuple[Path, Dict]) -> None:
+        """Stream one index file to disk without building it as a string"""
+        path, context = index_file
+        self.section_index_template.stream(context).dump(str(path), encoding='utf-8')
+    
+    def _generate_main_index(self, content_dir: Path, devsite_structure: Dict,
+                             index_files: List[Tuple[Path, Dict]]) -> None:
         """Generate main _index.md file"""
-        # Prepare context for main index
-        context = {
-            'title': self.config['hugo']['title'],
-            'description': self.config['hugo']['description'],
-            'sections': devsite_structure['sections'],
-            'type': 'docs',
-            'weight': 1
-        }
+        hugo_config = self.config['hugo']
         
-        # Render main index
-        template = self.template_env.get_template('section_index.jinja2')
-        index_content = template.render({
+        # Queue main index file
+        index_file = content_dir / '_index.md'
+        index_files.append((index_file, {
             'section': {
-                'title': context['title'],
-                'description': context['description'],
+                'title': hugo_config['title'],
+                'description': hugo_config['description'],
                 'type': 'docs',
                 'weight': 1,
             }
-        })
-        
-        # Write main index file
-        index_file = content_dir / '_index.md'
-        index_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(index_file, 'w', encoding='utf-8') as f:
-            f.write(index_content)
+        }))
         
         # Generate category index files
         if self.config.get('content_mapping').get('enable_category_indices'):
-            self._generate_category_indices(content_dir, devsite_structure)
+            self._generate_category_indices(content_dir, devsite_structure, index_files)
         
         logger.debug(f"Generated main index: {index_file}")
     
-    def _generate_category_indices(self, content_dir: Path, devsite_structure: Dict) -> None:
+    def _generate_category_indices(self, content_dir: Path, devsite_structure: Dict,
+                                   index_files: List[Tuple[Path, Dict]]) -> None:
         """Generate _index.md files for the 4 main categories"""
-        categories = {
-            'tutorials': {
-                'title': 'Tutorials',
-                'description': TUTORIALS_DESCRIPTION,
-                'weight': 1,
-                'sections': []
-            },
-            'how-to-guides': {
-                'title': 'How-To Guides', 
-                'description': HOW_TO_GUIDES_DESCRIPTION,
-                'weight': 2,
-                'sections': []
-            },
-            'explanations': {
-                'title': 'Explanations',
-                'description': EXPLANATIONS_DESCRIPTION,
-                'weight': 3,
-                'sections': []
-            },
-            'reference': {
-                'title': 'Reference',
-                'description': REFERENCE_DESCRIPTION,
-                'weight': 4,
-                'sections': []
-            }
-        }
-        
-        # Group sections by category
+        # Group sections by category in one pass
+        category_sections = {category_type: [] for category_type in CATEGORIES}
         for section in devsite_structure['sections']:
-            section_name = section['name']
-            if section_name in self.config['content_mapping']:
-                mapping = self.config['content_mapping'][section_name]
-                category_type = mapping['type']
-                if category_type in categories:
-                    categories[category_type]['sections'].append(section)
+            category_type = self._section_types.get(section['name'])
+            if category_type in category_sections:
+                category_sections[category_type].append(section)
         
         # Generate index file for each category
-        for category_type, category_info in categories.items():
+        for category_type, category_info in CATEGORIES.items():
             category_dir = content_dir / category_type
-            category_dir.mkdir(parents=True, exist_ok=True)
             
             # Prepare subsections
-            subsections = []
-            for section in category_info['sections']:
-                subsections.append({
-                    'title': section['title'],
-                    'path': f"/{category_type}/{section['name']}/",
-                    'description': f"{section['title']} documentation"
-                })
+            subsections = [_Subsection(
+                title=section['title'],
+                path=f"/{category_type}/{section['name']}/",
+                description=f"{section['title']} documentation"
+            ) for section in category_sections[category_type]]
             
-            # Render category index
-            template = self.template_env.get_template('section_index.jinja2')
-            index_content = template.render({
+            # Queue category index file
+            index_file = category_dir / '_index.md'
+            index_files.append((index_file, {
                 'section': {
                     'title': category_info['title'],
                     'description': category_info['description'],
@@ -182,109 +229,70 @@ class HugoGenerator:
                     'weight': category_info['weight'],
                     'subsections': subsections
                 }
-            })
-            
-            # Write category index file
-            index_file = category_dir / '_index.md'
-            with open(index_file, 'w', encoding='utf-8') as f:
-                f.write(index_content)
+            }))
             
             logger.debug(f"Generated category index: {index_file}")
     
-    def _generate_section_index(self, content_dir: Path, section: Dict) -> None:
-        """Generate _index.md file for a section"""
+    def _generate_section_index(self, content_dir: Path, section: Dict,
+                                index_files: List[Tuple[Path, Dict]]) -> None:
+        """Generate _index.md files for a section and its subsections"""
         # Determine the category for this section
         section_name = section['name']
-
-        
-        if section_name in self.config['content_mapping']:
-            mapping = self.config['content_mapping'][section_name]
-            category_type = mapping['type']
+        category_type = self._section_types[section_name]
         
         # Create section directory under its category
         section_dir = content_dir / category_type / section['name']
-        section_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Prepare subsections list
-        subsections = []
-        for file_info in section['files']:
-            if file_info['name'] != '_index.md':
-                subsections.append({
-                    'title': file_info['title'],
-                    'path': file_info['relative_path'].replace('.md', ''),
-                    'description': f"{file_info['title']} documentation"
-                })
         
-        # Add subsections from subdirectories
-        for subsection_name, subsection_info in section['subsections'].items():
-            subsections.append({
-                'title': subsection_name.replace('-', ' ').title(),
-                'path': f"{subsection_name}/",
-                'description': f"{subsection_name} documentation"
-            })
-        
-        # Prepare context
-        context = {
-            'section': {
-                'title': section['title'],
-                'linkTitle': section['title'],
-                'type': section['type'],
-                'weight': section['weight'],
-                'description': f"{section['title']} documentation and guides",
-                'subsections': subsections
-            }
+        # Each subsection title is used by both indices, so format it once
+        subsection_titles = {
+            subsection_name: subsection_name.translate(_DASH_TO_SPACE).title()
+            for subsection_name in section['subsections']
         }
         
-        # Render section index
-        template = self.template_env.get_template('section_index.jinja2')
-        index_content = template.render(context)
+        # Subdirectories are listed after the section's own pages
+        subdirectories = [_Subsection(
+            title=subsection_title,
+            path=f"{subsection_name}/",
+            description=f"{subsection_name} documentation"
+        ) for subsection_name, subsection_title in subsection_titles.items()]
         
-        # Write section index file
+        # Queue the section index, then one index per subsection in a flat
+        # loop; subsection indices list only their own pages
         index_file = section_dir / '_index.md'
-        with open(index_file, 'w', encoding='utf-8') as f:
-            f.write(index_content)
+        self._queue_index(index_file, {
+            'title': section['title'],
+            'linkTitle': section['title'],
+            'type': section['type'],
+            'weight': section['weight'],
+            'description': f"{section['title']} documentation and guides",
+        }, section['files'], subdirectories, index_files)
         
         logger.debug(f"Generated section index: {index_file}")
         
-        # Generate subsection indices recursively
         for subsection_name, subsection_info in section['subsections'].items():
-            self._generate_subsection_index(section_dir, subsection_name, subsection_info)
-    
-    def _generate_subsection_index(self, parent_dir: Path, subsection_name: str, 
-                                  subsection_info: Dict) -> None:
-        """Generate _index.md file for a subsection"""
-        subsection_dir = parent_dir / subsection_name
-        subsection_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Prepare subsections list
-        subsections = []
-        for file_info in subsection_info['files']:
-            if file_info['name'] != '_index.md':
-                subsections.append({
-                    'title': file_info['title'],
-                    'path': file_info['relative_path'].replace('.md', ''),
-                    'description': f"{file_info['title']} documentation"
-                })
-        
-        # Prepare context
-        context = {
-            'section': {
-                'title': subsection_name.replace('-', ' ').title(),
-                'linkTitle': subsection_name.replace('-', ' ').title(),
+            subsection_title = subsection_titles[subsection_name]
+            index_file = section_dir / subsection_name / '_index.md'
+            self._queue_index(index_file, {
+                'title': subsection_title,
+                'linkTitle': subsection_title,
                 'type': 'docs',
                 'weight': 1,
                 'description': f"{subsection_name} documentation and guides",
-                'subsections': subsections
-            }
-        }
-        
-        # Render subsection index
-        template = self.template_env.get_template('section_index.jinja2')
-        index_content = template.render(context)
-        
-        # Write subsection index file
-        index_file = subsection_dir / '_index.md'
-        with open(index_file, 'w', encoding='utf-8') as f:
-            f.write(index_content)
+            }, subsection_info['files'], [], index_files)
+            
+            logger.debug(f"Generated subsection index: {index_file}")
+    
+    def _queue_index(self, index_file: Path, section_context: Dict, files: List[Dict],
+                     subdirectories: List[_Subsection],
+                     index_files: List[Tuple[Path, Dict]]) -> None:
+        """Queue an _index.md listing a directory's pages, then its subdirectories"""
+        # Prepare subsections list from every page except the index itself
+        subsections = [_Subsection(
+            title=file_info['title'],
+            path=file_info['relative_path'].removesuffix('.md'),
+            description=f"{file_info['title']} documentation"
+        ) for file_info in files if file_info['name'] != '_index.md']
+        subsections.extend(subdirectories)
         
-        logger.debug(f"Generated subsection index: {index_file}")
+        section_context['subsections'] = subsections
+        index_files.append((index_file, {'section': section_context}))
@@ -43,7 +43,8 @@ if unzip -l "$ZIP_FILE" | grep -q '\.zip$'; then
     echo ""
     echo "Found nested zip file(s). Extracting..."
     mkdir -p "$TEMP_EXTRACT"
-    unzip -q "$ZIP_FILE" -d "$TEMP_EXTRACT"
+    # Only the nested archives are needed; the converter streams the rest
+    unzip -q "$ZIP_FILE" '*.zip' -d "$TEMP_EXTRACT"
     
     # Find the nested zip file(s) and use the first one
     NESTED_ZIP=$(find "$TEMP_EXTRACT" -name "*.zip" -type f | head -1)
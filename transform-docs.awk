@@ -111,12 +111,10 @@ in_code_block {
 }
 
 # Fix problematic {{ "<var>" }} and {{ '</var>' }} patterns
-{
+/\{\{/ {
     # These double curly braces with quotes break acorn parser
-    gsub(/\{\{ *"<var>" *\}\}/, "<var>", $0)
-    gsub(/\{\{ *"<\/var>" *\}\}/, "</var>", $0)
-    gsub(/\{\{ *'<var>' *\}\}/, "<var>", $0)
-    gsub(/\{\{ *'<\/var>' *\}\}/, "</var>", $0)
+    gsub(/\{\{ *("<var>"|'<var>') *\}\}/, "<var>", $0)
+    gsub(/\{\{ *("<\/var>"|'<\/var>') *\}\}/, "</var>", $0)
 }
 
 # Fix &lt; and &gt; that should be escaped differently in MDX
@@ -130,7 +128,7 @@ in_code_block {
 }
 
 # Fix empty thead tags - <thead></th> should be <thead>
-{
+/<\/?th/ {
     # Multiple variations of broken thead
     gsub(/<thead><\/th>/, "<thead>", $0)
     gsub(/<thead><\/thead>/, "<thead>", $0)
@@ -142,7 +140,7 @@ in_code_block {
 }
 
 # Fix malformed <img> tags with align attribute without quotes
-{
+/align=/ {
     # align=right should be align="right"
     gsub(/align=right/, "align=\"right\"", $0)
     gsub(/align=left/, "align=\"left\"", $0)
@@ -150,7 +148,7 @@ in_code_block {
 }
 
 # Fix malformed <col> tags - CORRECTED VERSION
-{
+/<col/ {
     # First, handle <col> with no attributes
     gsub(/<col>/, "<col />", $0)
     
@@ -169,7 +167,7 @@ in_code_block {
 }
 
 # Close other self-closing HTML tags properly
-{
+/<(br|img|hr)/ {
     # Fix <br> tags
     gsub(/<br>/, "<br />", $0)
     
@@ -199,7 +197,7 @@ in_code_block {
 }
 
 # Fix unclosed <code> tags in <code class="..."> patterns
-{
+/<code/ {
     # Fix escaped underscores in code tags like \_ 
     # These appear in patterns like noimplicit\_deps
     if (/<code>.*\\_.*<\/code>/) {
@@ -231,7 +229,7 @@ in_code_block {
 }
 
 # Fix malformed <a> tags
-{
+/<a / {
     # Ensure href has quotes
     while (match($0, /<a ([^>]*)href=([^"'][^ >]+)/)) {
         pre = substr($0, 1, RSTART - 1)